@@ -6,7 +6,9 @@ and thickness along.
 """
 
 import copy
+from functools import lru_cache
 import math
+import numpy as np
 from opencmiss.utils.zinc.field import findOrCreateFieldCoordinates, findOrCreateFieldTextureCoordinates
 from opencmiss.zinc.element import Element
 from opencmiss.zinc.field import Field
@@ -22,6 +24,36 @@ from scaffoldmaker.utils import interpolation as interp
 from scaffoldmaker.utils import tubemesh
 from scaffoldmaker.utils import vector
 
+SIN_60_DEGREES = math.sqrt(3)*0.5
+
+# Option names grouped by the limits applied in checkOptions
+MINIMUM_ONE_OPTION_NAMES = (
+    'Number of elements through wall',
+    'Refine number of elements around',
+    'Refine number of elements along segment',
+    'Refine number of elements through wall')
+MINIMUM_TWO_OPTION_NAMES = (
+    'Number of elements around tenia coli',
+    'Number of elements along segment')
+EVEN_OPTION_NAMES = (
+    'Number of elements around tenia coli',
+    'Number of elements around haustrum')
+NON_NEGATIVE_OPTION_NAMES = (
+    'Start inner radius',
+    'End inner radius',
+    'Haustrum inner radius factor',
+    'Segment length end derivative factor',
+    'Segment length mid derivative factor',
+    'Segment length',
+    'Tenia coli thickness',
+    'Wall thickness')
+MAXIMUM_ONE_OPTION_NAMES = (
+    'Corner inner radius factor',
+    'Segment length end derivative factor')
+TC_WIDTH_OPTION_NAMES = (
+    'Start tenia coli width',
+    'End tenia coli width')
+
 class MeshType_3d_colonsegment1(Scaffold_base):
     '''
     Generates a single 3-D colon segment mesh with variable
@@ -152,56 +184,41 @@ class MeshType_3d_colonsegment1(Scaffold_base):
 
     @staticmethod
     def checkOptions(options):
-        for key in [
-            'Number of elements through wall',
-            'Refine number of elements around',
-            'Refine number of elements along segment',
-            'Refine number of elements through wall']:
+        for key in MINIMUM_ONE_OPTION_NAMES:
             if options[key] < 1:
                 options[key] = 1
-        for key in [
-            'Number of elements around tenia coli',
-            'Number of elements along segment']:
+        for key in MINIMUM_TWO_OPTION_NAMES:
             if options[key] < 2:
                 options[key] = 2
         if options['Number of elements around haustrum'] < 4:
             options['Number of elements around haustrum'] = 4
-        for key in [
-            'Number of elements around tenia coli',
-            'Number of elements around haustrum']:
+        for key in EVEN_OPTION_NAMES:
             if options[key] % 2 > 0:
-                options[key] = options[key] + 1
-        for key in [
-            'Start inner radius',
-            'End inner radius',
-            'Haustrum inner radius factor',
-            'Segment length end derivative factor',
-            'Segment length mid derivative factor',
-            'Segment length',
-            'Tenia coli thickness',
-            'Wall thickness']:
+                options[key] += 1
+        for key in NON_NEGATIVE_OPTION_NAMES:
             if options[key] < 0.0:
                 options[key] = 0.0
         if options['Corner inner radius factor'] < 0.1:
             options['Corner inner radius factor'] = 0.1
-        for key in [
-            'Corner inner radius factor',
-            'Segment length end derivative factor']:
+        for key in MAXIMUM_ONE_OPTION_NAMES:
             if options[key] > 1.0:
                 options[key] = 1.0
         if options['Number of tenia coli'] < 1:
             options['Number of tenia coli'] = 1
         elif options['Number of tenia coli'] > 3:
             options['Number of tenia coli'] = 3
-        for key in [
-            'Start tenia coli width',
-            'End tenia coli width']:
-            if options[key] < 0.2*min(options['Start inner radius'], options['End inner radius']):
-                options[key] = round(0.2*min(options['Start inner radius'], options['End inner radius']), 2)
-        if options['Start tenia coli width'] > round(math.sqrt(3)*0.5*options['Start inner radius'], 2):
-            options['Start tenia coli width'] = round(math.sqrt(3)*0.5*options['Start inner radius'], 2)
-        if options['End tenia coli width'] > round(math.sqrt(3)*0.5*options['End inner radius'], 2):
-            options['End tenia coli width'] = round(math.sqrt(3)*0.5*options['End inner radius'], 2)
+        startRadius = options['Start inner radius']
+        endRadius = options['End inner radius']
+        minimumTCWidth = 0.2*min(startRadius, endRadius)
+        for key in TC_WIDTH_OPTION_NAMES:
+            if options[key] < minimumTCWidth:
+                options[key] = round(minimumTCWidth, 2)
+        maximumStartTCWidth = round(SIN_60_DEGREES*startRadius, 2)
+        if options['Start tenia coli width'] > maximumStartTCWidth:
+            options['Start tenia coli width'] = maximumStartTCWidth
+        maximumEndTCWidth = round(SIN_60_DEGREES*endRadius, 2)
+        if options['End tenia coli width'] > maximumEndTCWidth:
+            options['End tenia coli width'] = maximumEndTCWidth
 
     @classmethod
     def generateBaseMesh(cls, region, options):
@@ -249,21 +266,12 @@ class MeshType_3d_colonsegment1(Scaffold_base):
         sd2, sd12 = interp.interpolateSampleCubicHermite(cd2, cd12, se, sxi, ssf)
 
         # Find parameter variation along elementsCountAlongSegment
-        radiusAlongSegment = []
-        dRadiusAlongSegment = []
-        tcWidthAlongSegment = []
-
-        for n2 in range(elementsCountAlongSegment + 1):
-            xi = 1/elementsCountAlongSegment * n2
-            radius = interp.interpolateCubicHermite([startRadius], [startRadiusDerivative],
-                                                    [endRadius], [endRadiusDerivative], xi)[0]
-            radiusAlongSegment.append(radius)
-            dRadius = interp.interpolateCubicHermiteDerivative([startRadius], [startRadiusDerivative],
-                                                               [endRadius], [endRadiusDerivative], xi)[0]
-            dRadiusAlongSegment.append(dRadius)
-            tcWidth = interp.interpolateCubicHermite([startTCWidth], [startTCWidthDerivative],
-                                                     [endTCWidth], [endTCWidthDerivative], xi)[0]
-            tcWidthAlongSegment.append(tcWidth)
+        basis, dBasis = getCubicHermiteBasisAlongSegment(elementsCountAlongSegment)
+        radiusParameters = np.array([startRadius, startRadiusDerivative, endRadius, endRadiusDerivative])
+        tcWidthParameters = np.array([startTCWidth, startTCWidthDerivative, endTCWidth, endTCWidthDerivative])
+        radiusAlongSegment = (basis @ radiusParameters).tolist()
+        dRadiusAlongSegment = (dBasis @ radiusParameters).tolist()
+        tcWidthAlongSegment = (basis @ tcWidthParameters).tolist()
 
         haustrumInnerRadiusFactorAlongSegment = [haustrumInnerRadiusFactor]*(elementsCountAlongSegment + 1)
 
@@ -370,6 +378,14 @@ class ColonSegmentTubeMeshInnerPoints:
     Generates inner profile of a colon segment for use by tubemesh.
     """
 
+    __slots__ = ('_region', '_elementsCountAroundTC', '_elementsCountAroundHaustrum',
+                 '_elementsCountAlongSegment', '_tcCount', '_segmentLengthEndDerivativeFactor',
+                 '_segmentLengthMidDerivativeFactor', '_segmentLength', '_wallThickness',
+                 '_cornerInnerRadiusFactor', '_haustrumInnerRadiusFactorAlongElementList',
+                 '_innerRadiusAlongElementList', '_dInnerRadiusAlongElementList', '_tcWidthAlongElementList',
+                 '_tubeTCWidthList', '_xiList', '_relaxedLengthList', '_contractedWallThicknessList',
+                 '_startPhase')
+
     def __init__(self, region, elementsCountAroundTC, elementsCountAroundHaustrum,
         elementsCountAlongSegment, tcCount, segmentLengthEndDerivativeFactor,
         segmentLengthMidDerivativeFactor, segmentLength, wallThickness,
@@ -501,9 +517,9 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
     :return annotationGroupsAround: annotation groups for elements around.
     """
 
-    transitElementListHaustrum = ([0]*int(elementsCountAroundTC*0.5) + [1] +
-                                  [0]*int(elementsCountAroundHaustrum - 2) + [1] +
-                                  [0]*int(elementsCountAroundTC*0.5))
+    transitElementListHaustrum = ([0]*(elementsCountAroundTC//2) + [1] +
+                                  [0]*(elementsCountAroundHaustrum - 2) + [1] +
+                                  [0]*(elementsCountAroundTC//2))
     transitElementList = transitElementListHaustrum * tcCount
 
     # create nodes
@@ -513,7 +529,6 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
     sampleElementOut = 20
     segmentAxis = [0.0, 0.0, 1.0]
 
-    d2HalfSet = []
     d2Raw = []
     xInnerRaw = []
     dx_ds2InnerRaw = []
@@ -529,51 +544,55 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
     elementsCountAround = (elementsCountAroundTC + elementsCountAroundHaustrum)*tcCount
 
     if tcCount == 1:
+        # Profile only depends on radius and tenia coli width, so reuse it
+        # from the previous slice when both are unchanged along the segment
+        profileAlong = []
         for n2 in range(elementsCountAlongSegment + 1):
             radius = radiusSegmentList[n2]
             tcWidth = tcWidthSegmentList[n2]
-
-            xHalfSet, d1HalfSet = createHalfSetInterHaustralSegment(elementsCountAroundTC,
-                elementsCountAroundHaustrum, tcCount, tcWidth, radius, cornerInnerRadiusFactor, sampleElementOut)
-
-            for i in range(len(xHalfSet)):
-                d2HalfSet.append([0.0, 0.0, 0.0])
-            x, d1, _ = getFullProfileFromHalfHaustrum(xHalfSet, d1HalfSet, d2HalfSet, tcCount)
-            z = segmentLength/elementsCountAlongSegment * n2
-            d1Final = d1Final + d1
-            xFace = []
-            for n1 in range(elementsCountAroundTC + elementsCountAroundHaustrum):
-                xFinal.append([x[n1][0], x[n1][1], z])
-                xFace.append([x[n1][0], x[n1][1], z])
-            xiFace, lengthAroundFace = getXiListFromOuterLengthProfile(xFace, d1, segmentAxis,
-                wallThickness, transitElementList)
-            xiList.append(xiFace)
-            relaxedLengthList.append(lengthAroundFace)
-            contractedWallThicknessList.append(wallThickness)
-
+            if n2 == 0 or radius != radiusSegmentList[n2 - 1] or tcWidth != tcWidthSegmentList[n2 - 1]:
+                xHalfSet, d1HalfSet = createHalfSetInterHaustralSegment(elementsCountAroundTC,
+                    elementsCountAroundHaustrum, tcCount, tcWidth, radius, cornerInnerRadiusFactor, sampleElementOut)
+                d2HalfSet = [[0.0, 0.0, 0.0]]*len(xHalfSet)
+                x, d1, _ = getFullProfileFromHalfHaustrum(xHalfSet, d1HalfSet, d2HalfSet, tcCount)
+            profileAlong.append((x, d1))
+
+        zAlong = np.linspace(0.0, segmentLength, elementsCountAlongSegment + 1)
+        xAlong = np.empty((elementsCountAlongSegment + 1, elementsCountAround, 3))
+        xAlong[:, :, 2] = zAlong[:, np.newaxis]
+        d1Along = np.empty_like(xAlong)
+        xiAlong = np.empty((elementsCountAlongSegment + 1, elementsCountAround + 1))
+        relaxedLengthAlong = np.empty(elementsCountAlongSegment + 1)
+        for n2 in range(elementsCountAlongSegment + 1):
+            x, d1 = profileAlong[n2]
+            xAlong[n2, :, :2] = np.asarray(x)[:, :2]
+            d1Along[n2] = d1
+            xiAlong[n2], relaxedLengthAlong[n2] = getXiListFromOuterLengthProfile(xAlong[n2].tolist(), d1,
+                segmentAxis, wallThickness, transitElementList)
+
+        # Wall thickness is not contracted without haustra
+        contractedWallThicknessList = [wallThickness]*(elementsCountAlongSegment + 1)
+
+        d2Along = np.empty_like(xAlong)
+        d2Along[:-1] = xAlong[1:] - xAlong[:-1]
+        d2Along[-1] = xAlong[-1] - xAlong[-2]
         for n1 in range(elementsCountAround):
-            xUp = []
-            d2Up = []
-            for n2 in range(elementsCountAlongSegment + 1):
-                n = elementsCountAround * n2 + n1
-                xUp.append(xFinal[n])
-                d2 = [ xFinal[n + elementsCountAround][i] - xFinal[n][i] if n2 < elementsCountAlongSegment else
-                       xFinal[n][i] - xFinal[n - elementsCountAround][i] for i in range(3)]
-                d2Up.append(d2)
-            d2Smoothed = interp.smoothCubicHermiteDerivativesLine(xUp, d2Up)
+            d2Smoothed = interp.smoothCubicHermiteDerivativesLine(xAlong[:, n1].tolist(), d2Along[:, n1].tolist())
             d2Raw.append(d2Smoothed)
 
         # Re-arrange d2Raw
-        for n2 in range(elementsCountAlongSegment + 1):
-            for n1 in range(elementsCountAround):
-                d2Final.append(d2Raw[n1][n2])
+        xFinal = xAlong.reshape(-1, 3).tolist()
+        d1Final = d1Along.reshape(-1, 3).tolist()
+        d2Final = np.stack(d2Raw, axis=1).reshape(-1, 3).tolist()
+        xiList = xiAlong.tolist()
+        relaxedLengthList = relaxedLengthAlong.tolist()
 
         # Create annotation groups for mouse colon
         mzGroup = AnnotationGroup(region, get_colon_term("mesenteric zone"))
         nonmzGroup = AnnotationGroup(region, get_colon_term("non-mesenteric zone"))
-        elementsCountAroundGroups = [int(elementsCountAroundTC*0.5),
+        elementsCountAroundGroups = [elementsCountAroundTC//2,
                                      elementsCountAroundHaustrum,
-                                     int(elementsCountAroundTC * 0.5)]
+                                     elementsCountAroundTC//2]
 
         annotationGroupAround = [[mzGroup], [nonmzGroup], [mzGroup]]
 
@@ -584,7 +603,7 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
                 annotationGroupsAround.append(annotationGroupAround[i])
 
     else:
-        elementsCountAroundHalfHaustrum = int((elementsCountAroundTC + elementsCountAroundHaustrum)*0.5)
+        elementsCountAroundHalfHaustrum = (elementsCountAroundTC + elementsCountAroundHaustrum)//2
         d1AtStartOfEachMidFace = []
         d1Corrected = []
 
@@ -607,7 +626,7 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
                     d1Phase0LastFace = copy.deepcopy(d1HalfSetStart)
 
             if startPhase == 180.0:
-                if elementsCountAlongSegment % 2 == 0 and n2 == int(elementsCountAlongSegment * 0.5):
+                if elementsCountAlongSegment % 2 == 0 and n2 == elementsCountAlongSegment//2:
                     d1180MidFace = copy.deepcopy(d1HalfSetStart)
 
             xHalfSetMid, d1HalfSetMid = createHalfSetIntraHaustralSegment(
@@ -616,7 +635,7 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
 
             d1AtStartOfEachMidFace.append(d1HalfSetMid[0])
 
-            if startPhase == 0.0 and elementsCountAlongSegment % 2 == 0 and n2 == int(elementsCountAlongSegment * 0.5):
+            if startPhase == 0.0 and elementsCountAlongSegment % 2 == 0 and n2 == elementsCountAlongSegment//2:
                 d1Phase0MidFace = copy.deepcopy(d1HalfSetMid)
 
             if startPhase == 180.0:
@@ -715,7 +734,7 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
             dx_ds1InnerAroundList = []
             if startPhase == 0.0 and n2 == 0:
                 d1Corrected = d1Phase0FirstFace
-            elif startPhase == 0.0 and elementsCountAlongSegment%2 == 0 and n2 == int(elementsCountAlongSegment*0.5):
+            elif startPhase == 0.0 and elementsCountAlongSegment%2 == 0 and n2 == elementsCountAlongSegment//2:
                 dx_ds1InnerAroundList = dx_ds1InnerAroundList + d1Phase0MidFace
             elif startPhase == 0.0 and n2 > elementsCountAlongSegment - 1:
                 d1Corrected = d1Phase0LastFace
@@ -724,36 +743,36 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
                 dx_ds1InnerAroundList = dx_ds1InnerAroundList + d1180FirstFace
             elif startPhase == 180.0 and n2 > elementsCountAlongSegment - 1:
                 dx_ds1InnerAroundList = dx_ds1InnerAroundList + d1180LastFace
-            elif startPhase == 180.0 and elementsCountAlongSegment%2 == 0 and n2 == int(elementsCountAlongSegment*0.5):
+            elif startPhase == 180.0 and elementsCountAlongSegment%2 == 0 and n2 == elementsCountAlongSegment//2:
                 d1Corrected = d1180MidFace
 
             else:
+                dxAround = [[v2[c] - v1[c] for c in range(3)] for v1, v2 in zip(xAround[:-1], xAround[1:])]
                 for n1 in range(elementsCountAroundHalfHaustrum):
                     v1 = xAround[n1]
                     v2 = xAround[n1 + 1]
-                    d1 = d1AtStartOfEachMidFace[n2] if n1 == 0 else [v2[c] - v1[c] for c in range(3)]
-                    d2 = [v2[c] - v1[c] for c in range(3)]
+                    d1 = d1AtStartOfEachMidFace[n2] if n1 == 0 else dxAround[n1]
+                    d2 = dxAround[n1]
                     arcLengthAround = interp.computeCubicHermiteArcLength(v1, d1, v2, d2, True)
                     dx_ds1 = [c*arcLengthAround for c in vector.normalise(d1) ]
                     dx_ds1InnerAroundList.append(dx_ds1)
                 # Account for d1 of node sitting on half haustrum
-                d1 = vector.normalise([xAround[elementsCountAroundHalfHaustrum][c] -
-                                       xAround[elementsCountAroundHalfHaustrum - 1][c] for c in range(3)])
+                d1 = vector.normalise(dxAround[elementsCountAroundHalfHaustrum - 1])
                 dx_ds1 = [c*arcLengthAround for c in d1]
                 dx_ds1InnerAroundList.append(dx_ds1)
 
             if dx_ds1InnerAroundList:
                 d1Smoothed = interp.smoothCubicHermiteDerivativesLine(xAround, dx_ds1InnerAroundList,
                                                                       fixStartDerivative = True)
-                d1TCEdge = vector.setMagnitude(d1Smoothed[int(elementsCountAroundTC*0.5)],
-                                               vector.magnitude(d1Smoothed[int(elementsCountAroundTC*0.5 - 1)]))
-                d1Transition = vector.setMagnitude(d1Smoothed[int(elementsCountAroundTC*0.5 + 1)],
-                                                   vector.magnitude(d1Smoothed[int(elementsCountAroundTC*0.5 + 2)]))
+                d1TCEdge = vector.setMagnitude(d1Smoothed[elementsCountAroundTC//2],
+                                               vector.magnitude(d1Smoothed[elementsCountAroundTC//2 - 1]))
+                d1Transition = vector.setMagnitude(d1Smoothed[elementsCountAroundTC//2 + 1],
+                                                   vector.magnitude(d1Smoothed[elementsCountAroundTC//2 + 2]))
                 d1Corrected = []
-                d1Corrected = d1Corrected + d1Smoothed[:int(elementsCountAroundTC*0.5)]
+                d1Corrected = d1Corrected + d1Smoothed[:elementsCountAroundTC//2]
                 d1Corrected.append(d1TCEdge)
                 d1Corrected.append(d1Transition)
-                d1Corrected = d1Corrected + d1Smoothed[int(elementsCountAroundTC*0.5 + 2):]
+                d1Corrected = d1Corrected + d1Smoothed[elementsCountAroundTC//2 + 2:]
 
             xAlongList, d1AlongList, d2AlongList = getFullProfileFromHalfHaustrum(xAround, d1Corrected, d2Around,
                                                                                   tcCount)
@@ -786,6 +805,45 @@ def getColonSegmentInnerPoints(region, elementsCountAroundTC,
     return xFinal, d1Final, d2Final, transitElementList, xiList, relaxedLengthList, contractedWallThicknessList, \
            segmentAxis, annotationGroupsAround
 
+@lru_cache(maxsize=None)
+def getCubicHermiteBasisAlongSegment(elementsCountAlongSegment):
+    """
+    Get cubic Hermite basis functions and their derivatives evaluated at
+    xi = n2/elementsCountAlongSegment for each node along a segment. Values
+    of a scalar interpolated from v1, d1 to v2, d2 are obtained by multiplying
+    the basis with [v1, d1, v2, d2]. Cached as it only depends on the number
+    of elements along.
+    :param elementsCountAlongSegment: Number of elements along segment.
+    :return: Read-only arrays of basis and basis derivatives, each with shape
+    (elementsCountAlongSegment + 1, 4).
+    """
+    xi = np.linspace(0.0, 1.0, elementsCountAlongSegment + 1)
+    basis = np.stack(interp.getCubicHermiteBasis(xi), axis=1)
+    dBasis = np.stack(interp.getCubicHermiteBasisDerivatives(xi), axis=1)
+    basis.setflags(write=False)
+    dBasis.setflags(write=False)
+
+    return basis, dBasis
+
+@lru_cache(maxsize=None)
+def getUnitCirclePoints(elementsCountAround):
+    """
+    Get points and derivatives evenly spaced around a circle of unit radius
+    centred at the origin, starting on the x-axis. Circles of other radii are
+    obtained by scaling. Cached as it only depends on the number of elements
+    around.
+    :param elementsCountAround: Number of elements around.
+    :return: Read-only arrays of coordinates and derivatives with shape
+    (elementsCountAround, 3).
+    """
+    px, pd1 = createCirclePoints([ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ], [ 0.0, 1.0, 0.0 ], elementsCountAround)
+    x = np.array(px)
+    d1 = np.array(pd1)
+    x.setflags(write=False)
+    d1.setflags(write=False)
+
+    return x, d1
+
 def createHalfSetInterHaustralSegment(elementsCountAroundTC, elementsCountAroundHaustrum,
     tcCount, tcWidth, radius, cornerInnerRadiusFactor, sampleElementOut):
     """
@@ -814,12 +872,14 @@ def createHalfSetInterHaustralSegment(elementsCountAroundTC, elementsCountAround
 
     # Set up profile
     if tcCount < 3: # Circular profile
-        xLoop, d1Loop = createCirclePoints([ 0.0, 0.0, 0.0 ], [ radius, 0.0, 0.0 ], [ 0.0, radius, 0.0 ],
-            sampleElementOut, startRadians = 0.0)
+        xUnitLoop, d1UnitLoop = getUnitCirclePoints(sampleElementOut)
+        xLoop = (xUnitLoop*radius).tolist()
+        d1Loop = (d1UnitLoop*radius).tolist()
 
     else: # tcCount == 3, Triangular profile
         cornerRC = cornerInnerRadiusFactor*radius
         radiansRangeRC = [7*math.pi/4, 0.0, math.pi/4]
+        d1MagnitudeRC = cornerRC*math.pi/4.0
 
         for n1 in range(3):
             radiansAround = n1*2.0*math.pi / 3.0
@@ -833,7 +893,7 @@ def createHalfSetInterHaustralSegment(elementsCountAroundTC, elementsCountAround
                 sinRadiansRC = math.sin(radiansRC)
                 x = [xc[0] + cornerRC*cosRadiansRC, xc[1] + cornerRC*sinRadiansRC, 0.0]
                 xAround.append(x)
-                d1 = [ cornerRC*math.pi/4.0 * -sinRadiansRC, cornerRC*math.pi/4.0 * cosRadiansRC, 0.0]
+                d1 = [ d1MagnitudeRC * -sinRadiansRC, d1MagnitudeRC * cosRadiansRC, 0.0]
                 d1Around.append(d1)
 
         xSample = xAround[1:9] +[xAround[0], xAround[1]]
@@ -1015,7 +1075,7 @@ def sampleTeniaColi(nx, nd1, arcDistanceTCEdge, elementsCountAroundTC):
     xTC = []
     d1TC = []
     arcDistancePerElementTC = arcDistanceTCEdge / (elementsCountAroundTC*0.5)
-    for e in range(int(elementsCountAroundTC*0.5)+1):
+    for e in range(elementsCountAroundTC//2 + 1):
         arcDistance = arcDistancePerElementTC * e
         x, d1, _, _ = interp.getCubicHermiteCurvesPointAtArcDistance(nx, nd1, arcDistance)
         d1Scaled = vector.setMagnitude(d1, arcDistancePerElementTC)
@@ -1044,7 +1104,7 @@ def sampleHaustrum(nx, nd1, xTCLast, d1TCLast, arcLength, arcDistanceTCEdge,
     d1Haustrum = []
     elementLengths = []
     length = arcLength - arcDistanceTCEdge
-    elementsCountOut = int(elementsCountAroundHaustrum * 0.5)
+    elementsCountOut = elementsCountAroundHaustrum//2
     addLengthStart = 0.5 * vector.magnitude(d1TCLast)
     lengthFractionStart = 0.5
     proportionStart = 1.0
@@ -1125,24 +1185,18 @@ def getFullProfileFromHalfHaustrum(xHaustrumHalfSet, d1HaustrumHalfSet,
     d1Haustra = []
     d2Haustra = []
     rotAng = 2*math.pi/tcCount
+    cosRotAng = math.cos(rotAng)
+    sinRotAng = math.sin(rotAng)
 
     for n in range(1,len(xHaustrumHalfSet)):
         idx =  -n + len(xHaustrumHalfSet) - 1
         x = xHaustrumHalfSet[idx]
         d1 = d1HaustrumHalfSet[idx]
-        xReflect = [x[0], -x[1], x[2]]
-        d1Reflect = [d1[0], -d1[1], d1[2]]
-        xRot = [xReflect[0]*math.cos(rotAng) - xReflect[1]*math.sin(rotAng),
-                xReflect[0]*math.sin(rotAng) + xReflect[1]*math.cos(rotAng),
-                xReflect[2]]
-        d1Rot = [-(d1Reflect[0]*math.cos(rotAng) - d1Reflect[1]*math.sin(rotAng)),
-                -(d1Reflect[0]*math.sin(rotAng) + d1Reflect[1]*math.cos(rotAng)),
-                -d1Reflect[2]]
         d2 = d2HaustrumHalfSet[idx]
-        d2Reflect = [d2[0], -d2[1], d2[2]]
-        d2Rot = [(d2Reflect[0]*math.cos(rotAng) - d2Reflect[1]*math.sin(rotAng)),
-                (d2Reflect[0]*math.sin(rotAng) + d2Reflect[1]*math.cos(rotAng)),
-                d2Reflect[2]]
+        # Reflect across x-axis then rotate
+        xRot = [x[0]*cosRotAng + x[1]*sinRotAng, x[0]*sinRotAng - x[1]*cosRotAng, x[2]]
+        d1Rot = [-(d1[0]*cosRotAng + d1[1]*sinRotAng), -(d1[0]*sinRotAng - d1[1]*cosRotAng), -d1[2]]
+        d2Rot = [d2[0]*cosRotAng + d2[1]*sinRotAng, d2[0]*sinRotAng - d2[1]*cosRotAng, d2[2]]
         xHaustrumHalfSet2.append(xRot)
         d1HaustrumHalfSet2.append(d1Rot)
         d2HaustrumHalfSet2.append(d2Rot)
@@ -5,7 +5,9 @@ from opencmiss.zinc.context import Context
 from opencmiss.zinc.element import Element
 from opencmiss.zinc.field import Field
 from opencmiss.zinc.result import RESULT_OK
-from scaffoldmaker.meshtypes.meshtype_3d_colonsegment1 import MeshType_3d_colonsegment1
+from scaffoldmaker.meshtypes.meshtype_3d_colonsegment1 import MeshType_3d_colonsegment1, \
+    getCubicHermiteBasisAlongSegment
+from scaffoldmaker.utils import interpolation as interp
 from scaffoldmaker.utils.zinc_utils import createFaceMeshGroupExteriorOnFace
 from testutils import assertAlmostEqualList
 
@@ -132,5 +134,43 @@ class ColonSegmentScaffoldTestCase(unittest.TestCase):
         self.assertEqual(result, RESULT_OK)
         self.assertAlmostEqual(textureVolume, 1.0, delta=1.0E-6)
 
+    def test_checkoptionsteniacoliwidth(self):
+        """
+        Test tenia coli width is limited by minimum and maximum inner radius.
+        """
+        options = MeshType_3d_colonsegment1.getDefaultOptions("Human 1")
+        options['Start tenia coli width'] = 1.0
+        options['End tenia coli width'] = 100.0
+        MeshType_3d_colonsegment1.checkOptions(options)
+        self.assertEqual(6.6, options['Start tenia coli width'])
+        self.assertEqual(28.58, options['End tenia coli width'])
+
+        options = MeshType_3d_colonsegment1.getDefaultOptions("Human 1")
+        options['Start inner radius'] = 10.0
+        options['End inner radius'] = 40.0
+        options['Start tenia coli width'] = 50.0
+        options['End tenia coli width'] = 0.5
+        MeshType_3d_colonsegment1.checkOptions(options)
+        self.assertEqual(8.66, options['Start tenia coli width'])
+        self.assertEqual(2.0, options['End tenia coli width'])
+
+    def test_cubichermitebasisalongsegment(self):
+        """
+        Test cached cubic Hermite basis matches interpolation of values and derivatives along segment.
+        """
+        parameters = [43.5, 0.3, 33.0, -1.2]
+        for elementsCountAlongSegment in [1, 2, 4, 7]:
+            basis, dBasis = getCubicHermiteBasisAlongSegment(elementsCountAlongSegment)
+            self.assertEqual((elementsCountAlongSegment + 1, 4), basis.shape)
+            self.assertEqual((elementsCountAlongSegment + 1, 4), dBasis.shape)
+            values = basis @ parameters
+            derivatives = dBasis @ parameters
+            for n2 in range(elementsCountAlongSegment + 1):
+                xi = n2/elementsCountAlongSegment
+                self.assertAlmostEqual(values[n2], interp.interpolateCubicHermite(
+                    [parameters[0]], [parameters[1]], [parameters[2]], [parameters[3]], xi)[0], delta=1.0E-12)
+                self.assertAlmostEqual(derivatives[n2], interp.interpolateCubicHermiteDerivative(
+                    [parameters[0]], [parameters[1]], [parameters[2]], [parameters[3]], xi)[0], delta=1.0E-12)
+
 if __name__ == "__main__":
     unittest.main()